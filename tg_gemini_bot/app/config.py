@@ -37,14 +37,39 @@ TYPING_INTERVAL = float(os.getenv("TYPING_INTERVAL", "4.0"))                # se
 TELEGRAM_CHUNK_SIZE = int(os.getenv("TELEGRAM_CHUNK_SIZE", "3500"))         # safe under hard limit
 TELEGRAM_HARD_LIMIT = int(os.getenv("TELEGRAM_HARD_LIMIT", "4096"))
 
+# Delivery: long answers go out as one document instead of many messages
+DOCUMENT_THRESHOLD_CHARS = int(os.getenv("DOCUMENT_THRESHOLD_CHARS", "16000"))  # 0 disables documents
+DOCUMENT_PREVIEW_CHARS = int(os.getenv("DOCUMENT_PREVIEW_CHARS", "600"))       # caption, UTF-16 units, <= 1023
+DOCUMENT_EXT = os.getenv("DOCUMENT_EXT", "md").strip().lstrip(".").lower()     # md | txt
+if DOCUMENT_EXT not in ("md", "txt"):
+    DOCUMENT_EXT = "md"
+SEND_MAX_RETRIES = int(os.getenv("SEND_MAX_RETRIES", "3"))                     # per chunk, on flood wait
+
 # Streaming
 ENABLE_STREAMING = os.getenv("ENABLE_STREAMING", "1").strip() in ("1", "true", "True", "yes")
 
-# Logging
+# Startup: per-step import/init timings, pre-opened connections
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "0").strip() in ("1", "true", "True", "yes")
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "1").strip() in ("1", "true", "True", "yes")
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "10"))                  # seconds per warm-up step
+GEMINI_KEEPALIVE_TIMEOUT = float(os.getenv("GEMINI_KEEPALIVE_TIMEOUT", "300"))  # seconds, idle keep-alive
+
+# Runtime performance profile (opt-in): uvloop + fast JSON + tuned Telegram session
+PERF_PROFILE = os.getenv("PERF_PROFILE", "0").strip() in ("1", "true", "True", "yes")
+TG_CONN_LIMIT = int(os.getenv("TG_CONN_LIMIT", "100"))                     # aiohttp connector limit
+TG_KEEPALIVE_TIMEOUT = float(os.getenv("TG_KEEPALIVE_TIMEOUT", "60"))       # seconds, idle keep-alive
+DP_TASKS_CONCURRENCY = int(os.getenv("DP_TASKS_CONCURRENCY", "0"))          # 0 = unlimited update tasks
+LOOP_LAG_MONITOR = os.getenv("LOOP_LAG_MONITOR", "0").strip() in ("1", "true", "True", "yes")
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))            # seconds between probes
+LOOP_LAG_WARN_MS = float(os.getenv("LOOP_LAG_WARN_MS", "100"))              # log a warning above this
+
+# Logging (handlers are installed by setup_logging() from the entrypoint)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(level=getattr(logging, LOG_LEVEL, logging.INFO))
 log = logging.getLogger("gemini_bot")
 
+def setup_logging() -> None:
+    logging.basicConfig(level=getattr(logging, LOG_LEVEL, logging.INFO))
+
 def ensure_env() -> None:
     """Fail fast if required env vars are missing."""
     if not TELEGRAM_BOT_TOKEN:
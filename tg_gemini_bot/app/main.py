@@ -1,11 +1,35 @@
 
 # ---- entrypoint / polling ----
 import asyncio
-from aiogram import Bot, Dispatcher, Router, F
-from aiogram.client.default import DefaultBotProperties
-from aiogram.types import ChatMemberUpdated
+from contextlib import nullcontext
 
-from app import config
+from app.utils import startup
+
+with startup.step("import app.config"):
+    from app import config
+config.setup_logging()
+
+with startup.step("import aiogram"):
+    from aiogram import Bot, Dispatcher, Router, F
+    from aiogram.client.default import DefaultBotProperties
+    from aiogram.types import ChatMemberUpdated
+
+with startup.step("import app.utils.perf"):
+    from app.utils import perf
+
+# Leaves first, so each step times one app module rather than its whole subtree
+for _name in (
+    "app.services.memory",
+    "app.services.gemini",
+    "app.ui.chunking",
+    "app.ui.progress",
+    "app.ui.delivery",
+    "app.utils.media",
+    "app.utils.guards",
+    "app.routers.commands",
+    "app.routers.private_text",
+):
+    startup.timed_import(_name)
 from app.routers import commands, private_text
 
 def _build_dp() -> Dispatcher:
@@ -28,11 +52,37 @@ def _build_dp() -> Dispatcher:
     dp.include_router(sys_router)
     return dp
 
+# ---- warm-up ----
+async def _timed(name: str, coro) -> None:
+    with startup.step(name):
+        try:
+            await asyncio.wait_for(coro, timeout=config.WARMUP_TIMEOUT)
+        except asyncio.TimeoutError:
+            config.log.warning("warm-up %s timed out after %gs", name, config.WARMUP_TIMEOUT)
+        except Exception as e:
+            # Warm-up is best effort; the first request will retry lazily
+            config.log.warning("warm-up %s failed: %s", name, e)
+
+async def _warmup(bot: Bot) -> None:
+    """Pre-open Telegram and Gemini connections (SDK import included) concurrently."""
+    from app.services import gemini
+    await asyncio.gather(
+        _timed("warm-up telegram", bot.get_me()),
+        _timed("warm-up gemini", gemini.warmup()),
+    )
+
 async def main():
     config.ensure_env()
-    bot = Bot(token=config.TELEGRAM_BOT_TOKEN, default=DefaultBotProperties(parse_mode=None))
-    dp = _build_dp()
-    await dp.start_polling(bot)
+    with startup.step("init bot + dispatcher"):
+        session = perf.build_session() if config.PERF_PROFILE else None
+        bot = Bot(token=config.TELEGRAM_BOT_TOKEN, session=session, default=DefaultBotProperties(parse_mode=None))
+        dp = _build_dp()
+    if config.WARMUP_ON_START:
+        await _warmup(bot)
+    if config.STARTUP_PROFILE:
+        startup.report(config.log)
+    async with (perf.LoopLagMonitor() if config.LOOP_LAG_MONITOR else nullcontext()):
+        await dp.start_polling(bot, **perf.polling_kwargs())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    perf.run(main(), config.PERF_PROFILE)
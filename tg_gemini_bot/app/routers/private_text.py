@@ -9,7 +9,7 @@ from aiogram.types import Message
 
 from app import config
 from app.ui.progress import ProgressUI
-from app.ui.chunking import chunk_text
+from app.ui.delivery import deliver_answer
 from app.utils.media import extract_media_from_message
 from app.utils.guards import ChatGate
 from app.services import gemini
@@ -41,25 +41,14 @@ async def handle_private_message(m: Message):
                 if config.ENABLE_STREAMING:
                     if (m.text or '').startswith('/'):
                         return
-                    acc = ""
                     full = ""
                     async for delta in gemini.stream_generate(prompt, c, blobs if blobs else None):
-                        acc += delta
                         full += delta
-                        # Edit progress until first chunk is stable
-                        if len(acc) < config.TELEGRAM_CHUNK_SIZE:
-                            await ui.set_text(acc if acc else "Thinking…")
-                        else:
-                            # Send first full chunk, then continue via messages
-                            pieces = chunk_text(acc)
-                            await m.answer(pieces[0], disable_web_page_preview=True)
-                            for p in pieces[1:]:
-                                await m.answer(p, disable_web_page_preview=True)
-                            acc = ""
-                    # Flush tail if any
-                    if acc:
-                        for p in chunk_text(acc):
-                            await m.answer(p, disable_web_page_preview=True)
+                        # Edit progress while the answer still fits one message
+                        if len(full) < config.TELEGRAM_CHUNK_SIZE:
+                            await ui.set_text(full if full else "Thinking…")
+                    # Size is known only now: document or chunks
+                    await deliver_answer(m.bot, m.chat.id, full)
                 else:
                     # Non-streaming path
                     if (m.text or '').startswith('/'):
@@ -68,8 +57,7 @@ async def handle_private_message(m: Message):
                         reply = await gemini.generate_multimodal(prompt or "Analyze input.", c, blobs)
                     else:
                         reply = await gemini.generate_text(prompt, c)
-                    for p in chunk_text(reply):
-                        await m.answer(p, disable_web_page_preview=True)
+                    await deliver_answer(m.bot, m.chat.id, reply)
                     full = reply
 
             # ---- memory window ----
@@ -2,23 +2,52 @@
 # ---- gemini api ----
 from __future__ import annotations
 import asyncio
-from typing import Iterable, List, Tuple, AsyncGenerator, Optional
-
-from google import genai  # type: ignore
-from google.genai import types as genai_types  # type: ignore
+import threading
+from typing import TYPE_CHECKING, Iterable, List, Tuple, AsyncGenerator, Optional
 
 from app import config
 from app.services.memory import ChatCfg, build_memory_contents
 
-# Client (single instance)
+if TYPE_CHECKING:
+    from google import genai  # type: ignore
+    from google.genai import types as genai_types  # type: ignore
+
+# SDK is heavy; keep it off the startup path and import on first use
+def _types():
+    from google.genai import types as genai_types  # type: ignore
+    return genai_types
+
+# Client (single instance); built from worker threads, so guard the lazy init
 _client: Optional[genai.Client] = None
+_client_lock = threading.Lock()
 
 def client() -> genai.Client:
     global _client
-    if _client is None:
-        _client = genai.Client(api_key=config.GEMINI_API_KEY)
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is not None:
+            return _client
+        import httpx
+        from google import genai  # type: ignore
+        # httpx drops idle connections after 5s by default; keep the warmed one
+        limits = httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=config.GEMINI_KEEPALIVE_TIMEOUT,
+        )
+        _client = genai.Client(
+            api_key=config.GEMINI_API_KEY,
+            http_options=_types().HttpOptions(client_args={"limits": limits}),
+        )
     return _client
 
+async def warmup() -> None:
+    """Create the client and open its connection before the first user request."""
+    def _call() -> None:
+        client().models.get(model=config.GEMINI_MODEL)
+    await asyncio.to_thread(_call)
+
 def build_tools(cfg: ChatCfg):
     t = []
     if cfg.search:
@@ -31,10 +60,10 @@ def build_tools(cfg: ChatCfg):
 
 def _thinking_config(cfg: ChatCfg) -> genai_types.ThinkingConfig:
     from app.config import TH_BUDGETS, THINKING_DYNAMIC
-    return genai_types.ThinkingConfig(thinking_budget=TH_BUDGETS.get(cfg.mode, THINKING_DYNAMIC))
+    return _types().ThinkingConfig(thinking_budget=TH_BUDGETS.get(cfg.mode, THINKING_DYNAMIC))
 
 def _gen_config(cfg: ChatCfg) -> genai_types.GenerateContentConfig:
-    return genai_types.GenerateContentConfig(
+    return _types().GenerateContentConfig(
         tools=build_tools(cfg),
         max_output_tokens=config.MAX_OUTPUT_TOKENS,
         thinking_config=_thinking_config(cfg),
@@ -48,7 +77,7 @@ def _parts_from_blobs(blobs: List[Tuple[bytes, str]]) -> List[genai_types.Part]:
     parts: List[genai_types.Part] = []
     if total <= config.FILES_API_THRESHOLD_BYTES:
         for b, mime in blobs:
-            parts.append(genai_types.Part.from_bytes(b, mime_type=mime))
+            parts.append(_types().Part.from_bytes(b, mime_type=mime))
         return parts
 
     # Large: use Files API
@@ -56,7 +85,7 @@ def _parts_from_blobs(blobs: List[Tuple[bytes, str]]) -> List[genai_types.Part]:
     for b, mime in blobs:
         f = cl.files.upload(content=b, mime_type=mime)  # returns a file handle with a URI
         # Prefer using a file reference/URI part
-        parts.append(genai_types.Part.from_uri(f.uri))
+        parts.append(_types().Part.from_uri(f.uri))
     return parts
 
 def _compose_contents(prompt: str, cfg: ChatCfg, blobs: List[Tuple[bytes, str]] | None = None) -> List[genai_types.Content]:
@@ -64,11 +93,11 @@ def _compose_contents(prompt: str, cfg: ChatCfg, blobs: List[Tuple[bytes, str]]
     contents = build_memory_contents(cfg)
     user_parts: List[genai_types.Part] = []
     if prompt:
-        user_parts.append(genai_types.Part.from_text(prompt))
+        user_parts.append(_types().Part.from_text(prompt))
     if blobs:
         user_parts.extend(_parts_from_blobs(blobs))
     if user_parts:
-        contents.append(genai_types.Content(role="user", parts=user_parts))
+        contents.append(_types().Content(role="user", parts=user_parts))
     return contents
 
 async def generate_text(prompt: str, cfg: ChatCfg) -> str:
@@ -2,14 +2,15 @@
 # ---- session memory ----
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Deque, List, Tuple
+from typing import TYPE_CHECKING, Deque, List, Tuple
 from collections import deque
 import math
 
-from google.genai import types as genai_types  # type: ignore
-
 from app.config import MEMORY_TOKEN_LIMIT
 
+if TYPE_CHECKING:
+    from google.genai import types as genai_types  # type: ignore
+
 def approx_tokens(s: str) -> int:
     """Cheap token approximator; avoids heavy dependencies."""
     return max(1, math.ceil(len(s) / 4))
@@ -58,6 +59,8 @@ def build_memory_contents(cfg: ChatCfg) -> List[genai_types.Content]:
     """Return memory as a list of structured Content with roles, not concatenated strings."""
     if not cfg.history:
         return []
+    # SDK is heavy; import on first use, not at startup
+    from google.genai import types as genai_types  # type: ignore
     contents: List[genai_types.Content] = []
     for m in cfg.history:
         contents.append(
@@ -0,0 +1,91 @@
+
+# ---- answer delivery ----
+from __future__ import annotations
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import BufferedInputFile
+
+from app import config
+from app.ui.chunking import chunk_text
+
+@dataclass
+class DeliveryStats:
+    mode: str = "chunks"   # chunks | document
+    messages: int = 0
+    documents: int = 0
+    retries: int = 0
+    chars: int = 0
+    seconds: float = 0.0
+
+async def _with_retry(stats: DeliveryStats, call: Callable[[], Awaitable[Any]]) -> None:
+    """Run one Telegram call, waiting out flood limits (retry_after) up to SEND_MAX_RETRIES."""
+    attempt = 0
+    while True:
+        try:
+            await call()
+            return
+        except TelegramRetryAfter as e:
+            attempt += 1
+            if attempt > config.SEND_MAX_RETRIES:
+                raise
+            stats.retries += 1
+            await asyncio.sleep(e.retry_after)
+
+def _utf16_len(s: str) -> int:
+    # Telegram measures text limits in UTF-16 code units
+    return len(s.encode("utf-16-le")) // 2
+
+def _preview(text: str, limit: int) -> str:
+    """First lines of the answer, cut on a newline when possible; fits a caption."""
+    limit = max(1, min(limit, 1024 - 1))  # UTF-16 units; one left for "…"
+    if _utf16_len(text) <= limit:
+        return text
+    head = text[:limit]
+    while (over := _utf16_len(head) - limit) > 0:
+        head = head[:-max(1, over // 2)]
+    cut = head.rfind("\n")
+    if cut < int(0.5 * len(head)):
+        cut = len(head)
+    return head[:cut].rstrip() + "…"
+
+async def _send_document(bot: Bot, chat_id: int, text: str, stats: DeliveryStats) -> None:
+    doc = BufferedInputFile(text.encode("utf-8"), filename=f"answer.{config.DOCUMENT_EXT}")
+    caption = _preview(text, config.DOCUMENT_PREVIEW_CHARS)
+    await _with_retry(stats, lambda: bot.send_document(chat_id, doc, caption=caption))
+    stats.documents += 1
+
+async def _send_chunk(bot: Bot, chat_id: int, text: str, stats: DeliveryStats) -> None:
+    await _with_retry(stats, lambda: bot.send_message(chat_id, text, disable_web_page_preview=True))
+    stats.messages += 1
+
+async def deliver_answer(bot: Bot, chat_id: int, text: str) -> DeliveryStats:
+    """
+    Deliver a finished answer.
+    Above DOCUMENT_THRESHOLD_CHARS: one document with a short preview caption.
+    Otherwise: telegram-safe chunks, sent in order.
+    Raises ValueError on an empty answer so the caller can reply with an error.
+    """
+    if not text or not text.strip():
+        raise ValueError("empty answer")
+    stats = DeliveryStats(chars=len(text))
+    t0 = time.monotonic()
+    try:
+        if config.DOCUMENT_THRESHOLD_CHARS > 0 and len(text) > config.DOCUMENT_THRESHOLD_CHARS:
+            stats.mode = "document"
+            await _send_document(bot, chat_id, text, stats)
+        else:
+            for p in chunk_text(text):
+                if p.strip():
+                    await _send_chunk(bot, chat_id, p, stats)
+    finally:
+        stats.seconds = time.monotonic() - t0
+        config.log.info(
+            "delivery chat=%s mode=%s chars=%d messages=%d documents=%d retries=%d time=%.2fs",
+            chat_id, stats.mode, stats.chars, stats.messages, stats.documents, stats.retries, stats.seconds
+        )
+    return stats
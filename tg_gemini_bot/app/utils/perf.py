@@ -0,0 +1,141 @@
+
+# ---- runtime performance profile ----
+from __future__ import annotations
+import asyncio
+import json
+import ssl
+from typing import Any, Callable, Coroutine, Optional, Tuple
+
+import certifi
+from aiohttp import ClientSession, TCPConnector
+from aiohttp.hdrs import USER_AGENT
+from aiohttp.http import SERVER_SOFTWARE
+from aiogram import __version__ as aiogram_version
+from aiogram.client.session.aiohttp import AiohttpSession
+
+from app import config
+
+def _uvloop():
+    try:
+        import uvloop  # type: ignore
+        return uvloop
+    except Exception:
+        return None
+
+def run(coro: Coroutine[Any, Any, Any], perf: bool) -> Any:
+    """asyncio.run, or uvloop.run under the profile if uvloop is installed."""
+    uvloop = _uvloop() if perf else None
+    if perf and uvloop is None:
+        config.log.warning("PERF_PROFILE: uvloop is not installed, keeping asyncio loop")
+    if uvloop is None:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+def fast_json() -> Tuple[Callable[..., Any], Callable[..., str], str]:
+    """Return (loads, dumps, name): orjson, then msgspec, then stdlib json."""
+    try:
+        import orjson  # type: ignore
+        return orjson.loads, lambda obj: orjson.dumps(obj).decode(), "orjson"
+    except Exception:
+        pass
+    try:
+        import msgspec  # type: ignore
+        dec, enc = msgspec.json.Decoder(), msgspec.json.Encoder()
+        return dec.decode, lambda obj: enc.encode(obj).decode(), "msgspec"
+    except Exception:
+        pass
+    return json.loads, json.dumps, "json"
+
+class TunedAiohttpSession(AiohttpSession):
+    """
+    AiohttpSession whose connector gets limit and keep-alive directly.
+    Proxies are not supported.
+    """
+
+    def __init__(self, limit: int, keepalive_timeout: float, **kwargs: Any) -> None:
+        if kwargs.get("proxy") is not None:
+            raise ValueError("TunedAiohttpSession does not support proxies")
+        super().__init__(limit=limit, **kwargs)
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+
+    async def create_session(self) -> ClientSession:
+        # Stored in _session so the inherited close() shuts it down gracefully
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    ssl=ssl.create_default_context(cafile=certifi.where()),
+                    limit=self.limit,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=3600,
+                ),
+                headers={USER_AGENT: f"{SERVER_SOFTWARE} aiogram/{aiogram_version}"},
+            )
+        return self._session
+
+def build_session() -> AiohttpSession:
+    """Telegram session with fast JSON, connector limit and keep-alive from config."""
+    loads, dumps, name = fast_json()
+    session = TunedAiohttpSession(
+        limit=config.TG_CONN_LIMIT,
+        keepalive_timeout=config.TG_KEEPALIVE_TIMEOUT,
+        json_loads=loads,
+        json_dumps=dumps,
+    )
+    config.log.info(
+        "PERF_PROFILE: json=%s conn_limit=%d keepalive=%.0fs",
+        name, config.TG_CONN_LIMIT, config.TG_KEEPALIVE_TIMEOUT
+    )
+    return session
+
+def polling_kwargs() -> dict:
+    """Extra Dispatcher.start_polling arguments (update task concurrency)."""
+    if config.DP_TASKS_CONCURRENCY > 0:
+        return {"tasks_concurrency_limit": config.DP_TASKS_CONCURRENCY}
+    return {}
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a periodic sleeper.
+    Use as async context manager:
+        async with LoopLagMonitor() as mon:
+            ...
+        mon.max_ms, mon.avg_ms
+    """
+
+    def __init__(self, interval: float = config.LOOP_LAG_INTERVAL,
+                 warn_ms: Optional[float] = config.LOOP_LAG_WARN_MS) -> None:
+        self.interval = interval
+        self.warn_ms = warn_ms
+        self.samples = 0
+        self.max_ms = 0.0
+        self._total_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def avg_ms(self) -> float:
+        return self._total_ms / self.samples if self.samples else 0.0
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            t = loop.time()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - t - self.interval) * 1000)
+            self.samples += 1
+            self._total_ms += lag_ms
+            self.max_ms = max(self.max_ms, lag_ms)
+            if self.warn_ms is not None and lag_ms >= self.warn_ms:
+                config.log.warning("event loop lag %.1f ms", lag_ms)
@@ -0,0 +1,39 @@
+
+# ---- startup profile ----
+# Step timings for STARTUP_PROFILE=1; interpreter startup is not included.
+# For the full per-module import tree: python -X importtime -m app.main
+from __future__ import annotations
+import importlib
+import logging
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Iterator, List, Tuple
+
+# Origin: first import of this module (from app.main), not process start
+_T0 = time.perf_counter()
+_steps: List[Tuple[str, float]] = []
+
+@contextmanager
+def step(name: str) -> Iterator[None]:
+    """
+    Time one import or init step (wall clock, inclusive of nested imports).
+        with step("import aiogram"):
+            import aiogram
+    """
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        _steps.append((name, time.perf_counter() - t))
+
+def timed_import(name: str) -> ModuleType:
+    """Import one module as its own step; already imported dependencies cost nothing."""
+    with step(f"import {name}"):
+        return importlib.import_module(name)
+
+def report(log: logging.Logger) -> None:
+    """Log every recorded step and the time since app.main started importing."""
+    for name, dt in _steps:
+        log.info("startup %-32s %8.1f ms", name, dt * 1000)
+    log.info("startup %-32s %8.1f ms", "since app.main import", (time.perf_counter() - _T0) * 1000)
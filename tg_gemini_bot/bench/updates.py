@@ -0,0 +1,146 @@
+
+# ---- benchmark: default vs PERF_PROFILE on a synthetic update stream ----
+"""
+Feeds the same synthetic getUpdates stream through aiogram's real polling loop
+with stock asyncio + json and with the performance profile (uvloop, fast JSON).
+Both sides use the same task concurrency limit (DP_TASKS_CONCURRENCY unless
+--concurrency is given); runs alternate order every round and medians are
+reported. No network: a stub session serves the batches.
+
+    python -m bench.updates -n 20000 --batch 100 --repeat 3 --concurrency 0
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Callable, Deque, List, Optional
+
+from aiogram import Bot, Dispatcher, Router
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import GetMe, GetUpdates
+from aiogram.types import Message
+
+from app import config
+from app.utils import perf
+
+_ME = '{"ok":true,"result":{"id":123456,"is_bot":true,"first_name":"bench","username":"bench_bot"}}'
+_OK = '{"ok":true,"result":true}'
+
+def synthetic_batches(n: int, batch: int) -> List[str]:
+    """Raw getUpdates responses (private text messages, varying chats and lengths)."""
+    out: List[str] = []
+    for start in range(0, n, batch):
+        result = []
+        for i in range(start, min(n, start + batch)):
+            chat_id = 1000 + i % 500
+            result.append({
+                "update_id": i + 1,
+                "message": {
+                    "message_id": i + 1,
+                    "date": 1700000000 + i,
+                    "chat": {"id": chat_id, "type": "private", "first_name": "user"},
+                    "from": {"id": chat_id, "is_bot": False, "first_name": "user", "language_code": "ru"},
+                    "text": "привет, расскажи подробнее " * (1 + i % 20),
+                },
+            })
+        out.append(json.dumps({"ok": True, "result": result}, ensure_ascii=False))
+    return out
+
+class SyntheticSession(BaseSession):
+    """Serves pre-built getUpdates batches, then idles like an empty long poll."""
+
+    def __init__(self, batches: List[str], json_loads: Callable[..., Any]) -> None:
+        super().__init__(json_loads=json_loads)
+        self._batches: Deque[str] = deque(batches)
+
+    async def make_request(self, bot: Bot, method: Any, timeout: Optional[int] = None) -> Any:
+        if isinstance(method, GetUpdates):
+            if not self._batches:
+                await asyncio.Event().wait()
+            raw = self._batches.popleft()
+        elif isinstance(method, GetMe):
+            raw = _ME
+        else:
+            raw = _OK
+        return self.check_response(bot, method, 200, raw).result
+
+    async def stream_content(self, *args: Any, **kwargs: Any) -> AsyncGenerator[bytes, None]:
+        """Synthetic updates carry no files: every download is empty."""
+        for chunk in ():
+            yield chunk
+
+    async def close(self) -> None:
+        pass
+
+async def _run(batches: List[str], n: int, json_loads: Callable[..., Any], polling_kw: dict) -> dict:
+    bot = Bot(token="123456:BENCH", session=SyntheticSession(batches, json_loads))
+    dp = Dispatcher()
+    router = Router(name="bench")
+    done = asyncio.Event()
+    handled = 0
+
+    @router.message()
+    async def on_message(m: Message):
+        nonlocal handled
+        # Small amount of per-update work + one scheduling point
+        _ = len(m.text or "")
+        await asyncio.sleep(0)
+        handled += 1
+        if handled >= n:
+            done.set()
+
+    dp.include_router(router)
+    async with perf.LoopLagMonitor(interval=0.005, warn_ms=None) as mon:
+        t0 = time.perf_counter()
+        polling = asyncio.create_task(dp.start_polling(bot, handle_signals=False, **polling_kw))
+        await done.wait()
+        dt = time.perf_counter() - t0
+        await dp.stop_polling()
+        await polling
+    loop = type(asyncio.get_running_loop()).__module__.split(".")[0]
+    return {"seconds": dt, "rate": n / dt, "lag_max": mon.max_ms, "lag_avg": mon.avg_ms, "loop": loop}
+
+def _measure(perf_on: bool, batches: List[str], n: int, concurrency: int) -> dict:
+    loads, _, json_name = perf.fast_json() if perf_on else (json.loads, json.dumps, "json")
+    polling_kw = {"tasks_concurrency_limit": concurrency} if concurrency > 0 else {}
+    res = perf.run(_run(batches, n, loads, polling_kw), perf_on)
+    res["json"] = json_name
+    return res
+
+def _row(name: str, r: dict, concurrency: int) -> str:
+    return (f"{name:<9} {r['loop']:<8} {r['json']:<8} {concurrency or 'none':>6} {r['seconds']:>8.2f} "
+            f"{r['rate']:>9.0f} {r['lag_max']:>7.1f}ms {r['lag_avg']:>7.1f}ms")
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-n", "--updates", type=int, default=20000)
+    ap.add_argument("--batch", type=int, default=100, help="updates per getUpdates response")
+    ap.add_argument("--repeat", type=int, default=3, help="rounds; order alternates every round")
+    ap.add_argument("--concurrency", type=int, default=config.DP_TASKS_CONCURRENCY,
+                    help="tasks_concurrency_limit for both sides (0 = unlimited)")
+    args = ap.parse_args()
+
+    batches = synthetic_batches(args.updates, args.batch)
+    profiles = [("default", False), ("perf", True)]
+    results: dict = {name: [] for name, _ in profiles}
+    header = (f"{'profile':<9} {'loop':<8} {'json':<8} {'limit':>6} {'seconds':>8} "
+              f"{'upd/s':>9} {'lag max':>9} {'lag avg':>9}")
+    print(f"updates={args.updates} batch={args.batch} repeat={args.repeat}")
+    print(header)
+    for i in range(max(1, args.repeat)):
+        for name, perf_on in (profiles if i % 2 == 0 else profiles[::-1]):
+            r = _measure(perf_on, batches, args.updates, args.concurrency)
+            results[name].append(r)
+            print(_row(name, r, args.concurrency))
+
+    print("median")
+    for name, runs in results.items():
+        med = {k: statistics.median(r[k] for r in runs) for k in ("seconds", "rate", "lag_max", "lag_avg")}
+        med.update(loop=runs[0]["loop"], json=runs[0]["json"])
+        print(_row(name, med, args.concurrency))
+
+if __name__ == "__main__":
+    main()